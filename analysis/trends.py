@@ -4,36 +4,154 @@ Technology Trend Analysis
 Analyzes technology adoption trends from repo data.
 """
 
+import sys
+import time
+import warnings
+from array import array
+
+import numpy as np
 import pandas as pd
-from collections import Counter
-from datetime import datetime
+from collections import Counter, defaultdict
 from typing import Optional
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+_NAT = np.iinfo(np.int64).min
+
+
+def _parse_epochs(values: list) -> np.ndarray:
+    """Parse ISO 8601 timestamps to epoch seconds, _NAT if missing or malformed"""
+    with warnings.catch_warnings():
+        # numpy parses GitHub's trailing 'Z' as UTC but warns about it
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            dates = np.array(values, dtype="datetime64[s]")
+        except ValueError:
+            dates = np.array([_parse_one(v) for v in values], dtype="datetime64[s]")
+    return dates.astype(np.int64)
+
+
+def _parse_one(value) -> np.datetime64:
+    """Parse a single timestamp, NaT if malformed"""
+    try:
+        return np.datetime64(value, "s")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT")
+
+
+def _breakout_kernel(stars, created_epoch, now, min_stars, k):
+    """Growth rate of every repo and indices of the k fastest growing with min_stars"""
+    n = stars.shape[0]
+    growth = np.zeros(n)
+    top = np.empty(k, np.int64)
+    size = 0
+    for i in range(n):
+        if created_epoch[i] != _NAT:
+            growth[i] = stars[i] / max((now - created_epoch[i]) // 86400, 1)
+        if stars[i] < min_stars:
+            continue
+        
+        # Insert into the descending top-k; ties keep the earlier repo
+        if size < k:
+            j = size
+            size += 1
+        elif growth[i] > growth[top[k - 1]]:
+            j = k - 1
+        else:
+            continue
+        while j > 0 and growth[top[j - 1]] < growth[i]:
+            top[j] = top[j - 1]
+            j -= 1
+        top[j] = i
+    return growth, top[:size]
+
+
+if njit is not None:
+    _breakout_kernel = njit(cache=True)(_breakout_kernel)
+
 
 class TrendAnalyzer:
     """Analyzes technology trends"""
     
     def __init__(self):
         self.data = []
+        self._df: Optional[pd.DataFrame] = None
+        # Running aggregates, updated as repos are added
+        self._lang_counter = Counter()
+        self._topic_counter = Counter()
+        self._lang_stars = defaultdict(lambda: [0, 0])  # language -> [stars, repos]
+        # Columns parallel to self.data for whole-column numeric scans
+        self._stars = array("d")
+        self._created_at: list[Optional[str]] = []
     
     def add_repo(self, repo_data: dict):
         """Add repo data for analysis"""
+        # Convert everything that can fail before touching any state, so the
+        # columns never fall out of step with self.data
+        stars = float(repo_data.get("stars") or 0)
+        # Share one copy of each language/topic string across all repos
+        language = repo_data.get("language")
+        if language:
+            language = sys.intern(language)
+        topics = repo_data.get("topics")
+        if topics:
+            topics = [sys.intern(t) for t in topics]
+        
+        if language:
+            repo_data["language"] = language
+            self._lang_counter[language] += 1
+        if topics:
+            repo_data["topics"] = topics
+            self._topic_counter.update(topics)
+        
+        totals = self._lang_stars["Unknown" if language is None else language]
+        totals[0] += stars
+        totals[1] += 1
+        
         self.data.append(repo_data)
+        self._df = None
+        self._stars.append(stars)
+        self._created_at.append(repo_data.get("created_at"))
+    
+    def add_repo_batch(self, repos: list[dict]):
+        """Add a batch of repos, e.g. one page of search results"""
+        for repo_data in repos:
+            self.add_repo(repo_data)
+    
+    def _frame(self) -> pd.DataFrame:
+        """Get the repo data as a DataFrame, built once per batch of additions"""
+        if self._df is None:
+            self._df = pd.DataFrame(self.data)
+        return self._df
+    
+    def _column(self, name: str, default=None) -> pd.Series:
+        """Get a column, filled with `default` if no repo has the field"""
+        df = self._frame()
+        return df[name] if name in df else pd.Series(default, index=df.index, dtype=object)
     
     def get_language_trends(self) -> dict:
         """Get language adoption trends"""
-        languages = [r.get("language") for r in self.data if r.get("language")]
-        return dict(Counter(languages).most_common(20))
+        return dict(self._lang_counter.most_common(20))
     
     def get_topic_trends(self) -> dict:
         """Get trending topics"""
-        topics = []
-        for r in self.data:
-            topics.extend(r.get("topics", []))
-        return dict(Counter(topics).most_common(20))
+        return dict(self._topic_counter.most_common(20))
     
     def get_top_repos(self, metric: str = "stars", limit: int = 10) -> list:
         """Get top repos by metric"""
+        if metric == "stars":
+            # Index back into self.data so callers get the original dicts
+            order = np.argsort(-np.array(self._stars), kind="stable")[:limit]
+            return [self.data[i] for i in order]
+        
+        values = self._column(metric, 0).infer_objects()
+        if pd.api.types.is_numeric_dtype(values):
+            return [self.data[i] for i in values.fillna(0).nlargest(limit).index]
+        
         sorted_repos = sorted(
             self.data,
             key=lambda x: x.get(metric, 0),
@@ -44,42 +162,39 @@ class TrendAnalyzer:
     def calculate_growth_rate(self, repo_data: dict) -> float:
         """Calculate growth rate of a repo"""
         # Simple metric: stars / age in days
-        if "created_at" not in repo_data:
+        created = _parse_epochs([repo_data.get("created_at")])[0]
+        if created == _NAT:
             return 0
-        
-        try:
-            created = datetime.fromisoformat(repo_data["created_at"].replace("Z", "+00:00"))
-            age_days = (datetime.now() - created).days
-            if age_days > 0:
-                return repo_data.get("stars", 0) / age_days
-        except:
-            pass
-        return 0
+        age_days = max((int(time.time()) - int(created)) // 86400, 1)
+        return (repo_data.get("stars") or 0) / age_days
     
     def detect_breakout_repos(self, min_stars: int = 100) -> list:
         """Detect breakout repos (high growth)"""
-        for r in self.data:
-            r["growth_rate"] = self.calculate_growth_rate(r)
+        # Same metric as calculate_growth_rate, computed over whole columns
+        stars = np.array(self._stars)
+        created_epoch = _parse_epochs(self._created_at)
+        now = int(time.time())
         
-        breakout = [r for r in self.data if r.get("stars", 0) >= min_stars]
-        return sorted(breakout, key=lambda x: x.get("growth_rate", 0), reverse=True)[:10]
+        if njit is not None:
+            growth, top = _breakout_kernel(stars, created_epoch, now, float(min_stars), 10)
+        else:
+            age_days = np.maximum((now - created_epoch) // 86400, 1)
+            growth = np.where(created_epoch == _NAT, 0.0, stars / age_days)
+            candidates = np.flatnonzero(stars >= min_stars)
+            top = candidates[np.argsort(-growth[candidates], kind="stable")[:10]]
+        
+        for r, rate in zip(self.data, growth.tolist()):
+            r["growth_rate"] = rate
+        self._df = None  # the records gained a growth_rate column
+        
+        return [self.data[i] for i in top]
     
     def generate_heatmap_data(self) -> dict:
         """Generate heatmap data for visualization"""
-        # Language vs Stars
-        lang_stars = {}
-        for r in self.data:
-            lang = r.get("language", "Unknown")
-            stars = r.get("stars", 0)
-            if lang not in lang_stars:
-                lang_stars[lang] = []
-            lang_stars[lang].append(stars)
-        
         # Average stars per language
         return {
-            lang: sum(stars) / len(stars) 
-            for lang, stars in lang_stars.items() 
-            if len(stars) > 0
+            lang: stars / count
+            for lang, (stars, count) in self._lang_stars.items()
         }
 
 
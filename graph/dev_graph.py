@@ -4,50 +4,151 @@ Developer Influence Graph
 Builds and analyzes developer interaction graphs.
 """
 
+import io
+
 import networkx as nx
 from typing import Optional
 
+try:
+    import igraph as ig
+except ImportError:  # igraph is optional; NetworkX is used without it
+    ig = None
+
 
 class DeveloperGraph:
     """Graph of developer interactions"""
     
+    NODE_TYPES = {"dev": "developer", "repo": "repo"}
+    
     def __init__(self):
         self.graph = nx.DiGraph()
+        # Nodes are small ints; labels like "dev:name" live in the interning
+        # table so graph algorithms hash ints instead of strings
+        self._id: dict[str, int] = {}
+        self._rev: list[str] = []
+        # Scores are recomputed lazily after the graph changes
+        self._pagerank_cache: Optional[dict] = None
+        self._centrality_cache: Optional[dict] = None
+        self._ig_cache = None
+        self._dirty = True
+    
+    def _intern(self, kind: str, name: str) -> int:
+        """Get the node id for a label, adding the node if it is new"""
+        label = f"{kind}:{name}"
+        node = self._id.get(label)
+        if node is None:
+            node = len(self._rev)
+            self._id[label] = node
+            self._rev.append(label)
+            self.graph.add_node(node, type=self.NODE_TYPES[kind], label=label)
+        return node
+    
+    def _intern_many(self, kind: str, names: list[str]) -> list[int]:
+        """Get node ids for many labels, adding the new nodes in one call"""
+        ids, new_nodes = [], []
+        node_type = self.NODE_TYPES[kind]
+        for name in names:
+            label = f"{kind}:{name}"
+            node = self._id.get(label)
+            if node is None:
+                node = len(self._rev)
+                self._id[label] = node
+                self._rev.append(label)
+                new_nodes.append((node, {"type": node_type, "label": label}))
+            ids.append(node)
+        self.graph.add_nodes_from(new_nodes)
+        return ids
+    
+    def _lookup(self, kind: str, name: str) -> Optional[int]:
+        """Get the node id for a label without adding it"""
+        return self._id.get(f"{kind}:{name}")
+    
+    def _refresh(self):
+        """Drop cached scores if the graph changed"""
+        if self._dirty:
+            self._pagerank_cache = None
+            self._centrality_cache = None
+            self._ig_cache = None
+            self._dirty = False
+    
+    def _igraph(self):
+        """Get an igraph copy of the graph, or None if igraph isn't installed"""
+        if ig is None or len(self._rev) < 2:
+            return None
+        if self._ig_cache is None:
+            # Interned node ids are 0..n-1, so they double as igraph vertex ids
+            edges = list(self.graph.edges(data="weight", default=1))
+            self._ig_cache = ig.Graph(
+                n=len(self._rev),
+                edges=[(u, v) for u, v, _ in edges],
+                directed=True,
+                edge_attrs={"weight": [w for _, _, w in edges]}
+            )
+        return self._ig_cache
+    
+    def pagerank(self) -> dict:
+        """PageRank of every node, cached until the graph changes"""
+        self._refresh()
+        if self._pagerank_cache is None:
+            g = self._igraph()
+            if g is not None:
+                self._pagerank_cache = dict(enumerate(g.pagerank(weights="weight")))
+            else:
+                self._pagerank_cache = nx.pagerank(self.graph)
+        return self._pagerank_cache
+    
+    def degree_centrality(self) -> dict:
+        """Degree centrality of every node, cached until the graph changes"""
+        self._refresh()
+        if self._centrality_cache is None:
+            g = self._igraph()
+            if g is not None:
+                scale = 1 / (g.vcount() - 1)
+                self._centrality_cache = {
+                    n: d * scale for n, d in enumerate(g.degree(mode="all"))
+                }
+            else:
+                self._centrality_cache = nx.degree_centrality(self.graph)
+        return self._centrality_cache
     
     def add_contributor(self, repo: str, contributor: str, contributions: int = 1):
         """Add a contributor to a repo"""
-        # Add repo node
-        self.graph.add_node(f"repo:{repo}", type="repo")
-        
-        # Add developer node
-        self.graph.add_node(f"dev:{contributor}", type="developer")
-        
+        self._dirty = True
         # Add edge (developer -> repo)
         self.graph.add_edge(
-            f"dev:{contributor}", 
-            f"repo:{repo}", 
+            self._intern("dev", contributor),
+            self._intern("repo", repo),
             weight=contributions,
             type="contributed_to"
         )
     
+    def add_contributors_bulk(self, repo: str, contributors: list[tuple[str, int]]):
+        """Add (login, contributions) pairs to a repo, e.g. one page of contributors"""
+        self._dirty = True
+        repo_node = self._intern("repo", repo)
+        devs = self._intern_many("dev", [login for login, _ in contributors])
+        self.graph.add_edges_from(
+            (dev, repo_node, {"weight": contributions, "type": "contributed_to"})
+            for dev, (_, contributions) in zip(devs, contributors)
+        )
+    
     def add_follow(self, follower: str, following: str):
         """Add a follow relationship"""
-        self.graph.add_node(f"dev:{follower}", type="developer")
-        self.graph.add_node(f"dev:{following}", type="developer")
+        self._dirty = True
         self.graph.add_edge(
-            f"dev:{follower}",
-            f"dev:{following}",
+            self._intern("dev", follower),
+            self._intern("dev", following),
             type="follows"
         )
     
     def get_top_developers(self, limit: int = 10) -> list:
         """Get most connected developers"""
         # Calculate degree centrality
-        devs = [n for n in self.graph.nodes() if n.startswith("dev:")]
-        centrality = nx.degree_centrality(self.graph)
+        devs = [n for n, t in self.graph.nodes(data="type") if t == "developer"]
+        centrality = self.degree_centrality()
         
         sorted_devs = sorted(
-            [(d, centrality[d]) for d in devs if d in centrality],
+            [(self._rev[d], centrality[d]) for d in devs if d in centrality],
             key=lambda x: x[1],
             reverse=True
         )
@@ -55,41 +156,57 @@ class DeveloperGraph:
     
     def get_influential_devs(self, repo: str) -> list:
         """Get most influential devs in a repo"""
-        repo_node = f"repo:{repo}"
-        if repo_node not in self.graph:
+        repo_node = self._lookup("repo", repo)
+        if repo_node is None:
             return []
         
         # Get contributors to this repo
         contributors = list(self.graph.predecessors(repo_node))
         
         # Calculate their influence ( PageRank)
-        pagerank = nx.pagerank(self.graph)
+        pagerank = self.pagerank()
         
         sorted_contributors = sorted(
-            [(c, pagerank.get(c, 0)) for c in contributors],
+            [(self._rev[c], pagerank.get(c, 0)) for c in contributors],
             key=lambda x: x[1],
             reverse=True
         )
         return sorted_contributors
     
-    def find_connections(self, dev1: str, dev2: str) -> list:
+    def find_connections(self, dev1: str, dev2: str, weight: Optional[str] = None) -> list:
         """Find shortest path between two developers"""
+        source, target = self._lookup("dev", dev1), self._lookup("dev", dev2)
+        if source is None or target is None:
+            return []
         try:
-            path = nx.shortest_path(
-                self.graph, 
-                f"dev:{dev1}", 
-                f"dev:{dev2}"
-            )
-            return path
+            # Search from both ends; the frontiers meet long before either
+            # side has explored the whole graph
+            if weight:
+                _, path = nx.bidirectional_dijkstra(self.graph, source, target, weight=weight)
+            else:
+                path = nx.bidirectional_shortest_path(self.graph, source, target)
+            return [self._rev[n] for n in path]
         except nx.NetworkXNoPath:
             return []
     
     def export_graph(self, format: str = "gexf") -> str:
         """Export graph to file"""
         if format == "gexf":
-            from networkx.readwrite import json_graph
-            return json_graph.gexf.dumps(self.graph)
-        return str(self.graph.nodes())
+            # GEXF reserves the edge "type" attribute for directed/undirected,
+            # so export the relationship as "relation"
+            graph = self.graph.copy()
+            for _, _, data in graph.edges(data=True):
+                if "type" in data:
+                    data["relation"] = data.pop("type")
+            buf = io.BytesIO()
+            nx.write_gexf(graph, buf)
+            return buf.getvalue().decode()
+        if format == "graphml":
+            # Uses lxml when installed, falling back to ElementTree
+            buf = io.BytesIO()
+            nx.write_graphml_lxml(self.graph, buf)
+            return buf.getvalue().decode()
+        return str([self._rev[n] for n in self.graph.nodes()])
 
 
 if __name__ == "__main__":
@@ -97,11 +214,12 @@ if __name__ == "__main__":
     g = DeveloperGraph()
     
     # Add some contributors
-    g.add_contributor("facebook/react", "dan_abramov", 500)
-    g.add_contributor("facebook/react", "sebmarkbage", 300)
-    g.add_contributor("facebook/react", "acdlite", 200)
-    g.add_contributor("vercel/next.js", "leerob", 400)
-    g.add_contributor("vercel/next.js", "shu_fff", 300)
+    g.add_contributors_bulk("facebook/react", [
+        ("dan_abramov", 500),
+        ("sebmarkbage", 300),
+        ("acdlite", 200)
+    ])
+    g.add_contributors_bulk("vercel/next.js", [("leerob", 400), ("shu_fff", 300)])
     
     # Add cross-repo connections (same dev contributes to multiple)
     g.add_contributor("facebook/react", "acdlite", 100)
@@ -6,17 +6,32 @@ Enhanced GitHub scraper with rate limiting and pagination.
 
 import asyncio
 import os
+import re
+import shelve
+import time
+from collections import OrderedDict
 from typing import Optional
 import httpx
+import orjson
 from pydantic import BaseModel, Field
 
 
+_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+
+
 class GitHubClient:
     """Enhanced GitHub API client"""
     
     BASE_URL = "https://api.github.com"
+    MAX_CONCURRENCY = 10
+    MAX_RETRIES = 3
+    MAX_RESET_WAIT = 3600
+    SEARCH_RESULT_CAP = 1000  # GitHub returns at most this many search results
+    ETAG_CACHE_SIZE = 512  # responses kept in memory when no cache_path is given
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, timeout: int = 30,
+                 cache_path: Optional[str] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.headers = {
             "User-Agent": "GitHub-Intelligence/1.0",
@@ -24,10 +39,29 @@ class GitHubClient:
         }
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
-        self.client = httpx.AsyncClient(headers=self.headers)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=timeout,
+            transport=transport
+        )
+        # Cap in-flight requests to stay clear of GitHub's secondary rate limits
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        # Rate limit budgets shared by every request on this client, one per
+        # GitHub resource (core, search, ...) as named by X-RateLimit-Resource
+        self._rl_lock = asyncio.Lock()
+        self._remaining: dict[str, int] = {}
+        self._reset_at: dict[str, float] = {}  # time.monotonic() deadlines
+        # url -> (etag, body, link header); 304s don't count against the rate limit.
+        # Pass cache_path to keep it on disk across runs; otherwise it is an
+        # in-memory LRU of ETAG_CACHE_SIZE responses.
+        self._etag_cache = shelve.open(cache_path) if cache_path else OrderedDict()
     
     async def close(self):
         await self.client.aclose()
+        if isinstance(self._etag_cache, shelve.Shelf):
+            self._etag_cache.close()
     
     async def __aenter__(self):
         return self
@@ -35,189 +69,265 @@ class GitHubClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
     
+    @staticmethod
+    def _resource(url: str) -> str:
+        """Guess which rate limit bucket a request draws from"""
+        path = httpx.URL(url).path
+        if path.startswith("/search/code"):
+            return "code_search"
+        if path.startswith("/search/"):
+            return "search"
+        return "core"
+    
+    async def _acquire(self, resource: str):
+        """Reserve one request from the resource's budget, waiting for reset if spent"""
+        async with self._rl_lock:
+            remaining = self._remaining.get(resource)
+            if remaining is not None and remaining <= 1:
+                wait_time = self._reset_at[resource] - time.monotonic()
+                if wait_time > 0:
+                    print(f"Rate limit low ({remaining}), waiting {wait_time:.0f}s")
+                    await asyncio.sleep(wait_time)
+                del self._remaining[resource]
+            elif remaining is not None:
+                self._remaining[resource] = remaining - 1
+    
+    def _update_rate_limit(self, response: httpx.Response, resource: str):
+        """Record the budget reported by GitHub"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        
+        # The reset header is a unix timestamp; keep the deadline on the monotonic
+        # clock, clamped so a skewed header can't stall the client for hours
+        wait_time = max(0, min(self.MAX_RESET_WAIT, int(reset) - time.time()))
+        reset_at = time.monotonic() + wait_time
+        current = self._remaining.get(resource)
+        if (current is None or reset_at > self._reset_at[resource] + 1
+                or response.status_code == 304):
+            # New window, or a 304, which GitHub doesn't charge for; its header
+            # hands back the request _acquire reserved
+            self._remaining[resource] = int(remaining)
+        else:
+            # Responses arrive out of order; never raise the budget within a window
+            self._remaining[resource] = min(current, int(remaining))
+        self._reset_at[resource] = reset_at
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response is final"""
+        if response.status_code in (403, 429):
+            if "Retry-After" in response.headers:
+                # Secondary rate limit
+                return float(response.headers["Retry-After"])
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                # Primary rate limit; _acquire waits for the reset
+                return 0
+        elif response.status_code >= 500:
+            return 2 ** attempt
+        return None
+    
+    def _cache_get(self, key: str) -> Optional[tuple]:
+        """Look up a cached response, marking it recently used"""
+        cached = self._etag_cache.get(key)
+        if cached and isinstance(self._etag_cache, OrderedDict):
+            self._etag_cache.move_to_end(key)
+        return cached
+    
+    def _cache_put(self, key: str, value: tuple):
+        """Cache a response, evicting the least recently used in memory"""
+        self._etag_cache[key] = value
+        if isinstance(self._etag_cache, OrderedDict):
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+    
     async def get(self, url: str, **kwargs):
         """Make request with rate limit handling"""
-        response = await self.client.get(url, **kwargs)
+        key = str(httpx.URL(url, params=kwargs.get("params")))
+        cached = self._cache_get(key)
+        if cached:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
         
-        # Check rate limit
-        remaining = int(response.headers.get("X-RateLimit-Remaining", 60))
-        if remaining < 5:
-            reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-            wait_time = max(0, reset_time - asyncio.get_event_loop().time())
-            if wait_time > 0:
-                print(f"Rate limit low ({remaining}), waiting {wait_time}s")
-                await asyncio.sleep(wait_time)
+        resource = self._resource(url)
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._acquire(resource)
+            async with self._semaphore:
+                response = await self.client.get(url, **kwargs)
+            self._update_rate_limit(response, resource)
+            
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.MAX_RETRIES:
+                break
+            await asyncio.sleep(delay)
+        
+        if cached and response.status_code == 304:
+            _, content, link = cached
+            return httpx.Response(
+                200,
+                content=content,
+                headers={"Link": link} if link else None,
+                request=response.request
+            )
         
         response.raise_for_status()
+        if "ETag" in response.headers:
+            self._cache_put(key, (
+                response.headers["ETag"],
+                response.content,
+                response.headers.get("Link")
+            ))
         return response
     
-    async def search_repos(self, query: str, sort: str = "stars", per_page: int = 100) -> list:
-        """Search repositories with pagination"""
-        all_repos = []
-        page = 1
+    @staticmethod
+    def _last_page(response: httpx.Response) -> int:
+        """Get the last page number from the Link header"""
+        url = response.links.get("last", {}).get("url", "")
+        match = _PAGE_RE.search(url)
+        return int(match.group(1)) if match else 1
+    
+    async def _paginate(self, url: str, params: Optional[dict] = None,
+                        limit: int = 100, key: Optional[str] = None) -> list:
+        """Fetch up to `limit` items, requesting the remaining pages concurrently"""
+        if limit <= 0:
+            return []
+        per_page = min(100, limit)
+        params = {**(params or {}), "per_page": per_page}
         
-        while len(all_repos) < per_page:
-            response = await self.get(
-                f"{self.BASE_URL}/search/repositories",
-                params={
-                    "q": query,
-                    "sort": sort,
-                    "per_page": min(100, per_page - len(all_repos)),
-                    "page": page
-                }
-            )
-            
-            items = response.json().get("items", [])
-            if not items:
-                break
-            
-            all_repos.extend(items)
-            page += 1
-            
-            # Check if we hit the search limit
-            if len(items) < 100:
-                break
+        response = await self.get(url, params={**params, "page": 1})
+        data = orjson.loads(response.content)
+        items = data.get(key, []) if key else data
+        
+        # The first page tells us how many more there are; fetch them all at once,
+        # stopping at the page that completes `limit`
+        last_page = min(self._last_page(response), -(-limit // per_page))
+        if last_page > 1:
+            responses = await asyncio.gather(*(
+                self.get(url, params={**params, "page": page})
+                for page in range(2, last_page + 1)
+            ))
+            for r in responses:
+                data = orjson.loads(r.content)
+                items.extend(data.get(key, []) if key else data)
         
-        return all_repos
+        return items[:limit]
+    
+    async def search_repos(self, query: str, sort: str = "stars", per_page: int = 100) -> list:
+        """Search repositories with pagination"""
+        return await self._paginate(
+            f"{self.BASE_URL}/search/repositories",
+            params={"q": query, "sort": sort},
+            # Pages past the cap fail with 422
+            limit=min(per_page, self.SEARCH_RESULT_CAP),
+            key="items"
+        )
     
     async def get_user(self, username: str) -> dict:
         """Get user profile"""
         response = await self.get(f"{self.BASE_URL}/users/{username}")
-        return response.json()
+        return orjson.loads(response.content)
     
     async def get_user_repos(self, username: str, sort: str = "updated") -> list:
         """Get user repositories"""
-        repos = []
-        page = 1
-        
-        while len(repos) < 100:
-            response = await self.get(
-                f"{self.BASE_URL}/users/{username}/repos",
-                params={"per_page": 100, "page": page, "sort": sort}
-            )
-            
-            items = response.json()
-            if not items:
-                break
-            
-            repos.extend(items)
-            page += 1
-        
-        return repos
+        return await self._paginate(
+            f"{self.BASE_URL}/users/{username}/repos",
+            params={"sort": sort}
+        )
     
     async def get_repo(self, owner: str, repo: str) -> dict:
         """Get repository"""
         response = await self.get(f"{self.BASE_URL}/repos/{owner}/{repo}")
-        return response.json()
+        return orjson.loads(response.content)
     
     async def get_contributors(self, owner: str, repo: str) -> list:
         """Get contributors"""
-        contributors = []
-        page = 1
-        
-        while len(contributors) < 100:
-            response = await self.get(
-                f"{self.BASE_URL}/repos/{owner}/{repo}/contributors",
-                params={"per_page": 100, "page": page}
-            )
-            
-            items = response.json()
-            if not items:
-                break
-            
-            contributors.extend(items)
-            page += 1
-        
-        return contributors
+        return await self._paginate(f"{self.BASE_URL}/repos/{owner}/{repo}/contributors")
     
     async def get_stargazers(self, owner: str, repo: str) -> list:
         """Get stargazers"""
-        stars = []
-        page = 1
-        
-        while len(stars) < 1000:
-            response = await self.get(
-                f"{self.BASE_URL}/repos/{owner}/{repo}/stargazers",
-                params={"per_page": 100, "page": page}
-            )
-            
-            items = response.json()
-            if not items:
-                break
-            
-            stars.extend([s.get("login") for s in items])
-            page += 1
-        
-        return stars
+        stars = await self._paginate(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/stargazers",
+            limit=1000
+        )
+        return [s.get("login") for s in stars]
 
 
-async def search_trending_repos(language: str = "", since: str = "daily") -> list:
-    """Search trending repositories"""
+async def search_trending_repos(language: str = "", since: str = "daily",
+                                client: Optional[GitHubClient] = None) -> list:
+    """Search trending repositories; pass `client` to reuse its connection pool"""
     
     query = f"stars:>100"
     if language:
         query += f" language:{language}"
     
-    async with GitHubClient() as client:
-        return await client.search_repos(query, sort="stars", per_page=100)
+    if client is None:
+        async with GitHubClient() as client:
+            return await client.search_repos(query, sort="stars", per_page=100)
+    return await client.search_repos(query, sort="stars", per_page=100)
 
 
-async def analyze_user(username: str) -> dict:
-    """Analyze a GitHub user"""
+async def analyze_user(username: str, client: Optional[GitHubClient] = None) -> dict:
+    """Analyze a GitHub user; pass `client` to reuse its connection pool"""
     
-    async with GitHubClient() as client:
-        # Get user profile
-        user = await client.get_user(username)
-        
-        # Get repos
-        repos = await client.get_user_repos(username)
-        
-        # Analyze
-        total_stars = sum(r.get("stargazers_count", 0) for r in repos)
-        total_forks = sum(r.get("forks_count", 0) for r in repos)
-        
-        languages = {}
-        for repo in repos:
-            lang = repo.get("language")
-            if lang:
-                languages[lang] = languages.get(lang, 0) + 1
-        
-        return {
-            "username": username,
-            "name": user.get("name"),
-            "bio": user.get("bio"),
-            "followers": user.get("followers"),
-            "following": user.get("following"),
-            "public_repos": user.get("public_repos"),
-            "total_stars": total_stars,
-            "total_forks": total_forks,
-            "languages": languages,
-            "top_repos": sorted(
-                repos, 
-                key=lambda r: r.get("stargazers_count", 0),
-                reverse=True
-            )[:10]
-        }
+    if client is None:
+        async with GitHubClient() as client:
+            return await analyze_user(username, client)
+    
+    # Get user profile and repos
+    user, repos = await asyncio.gather(
+        client.get_user(username),
+        client.get_user_repos(username)
+    )
+    
+    # Analyze
+    total_stars = sum(r.get("stargazers_count", 0) for r in repos)
+    total_forks = sum(r.get("forks_count", 0) for r in repos)
+    
+    languages = {}
+    for repo in repos:
+        lang = repo.get("language")
+        if lang:
+            languages[lang] = languages.get(lang, 0) + 1
+    
+    return {
+        "username": username,
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "followers": user.get("followers"),
+        "following": user.get("following"),
+        "public_repos": user.get("public_repos"),
+        "total_stars": total_stars,
+        "total_forks": total_forks,
+        "languages": languages,
+        "top_repos": sorted(
+            repos, 
+            key=lambda r: r.get("stargazers_count", 0),
+            reverse=True
+        )[:10]
+    }
 
 
 if __name__ == "__main__":
-    import json
-    
     async def main():
-        # Search trending
-        print("Finding trending Python repos...")
-        repos = await search_trending_repos("python")
-        print(f"Found {len(repos)} repos")
+        # One client, so both lookups share a connection pool
+        async with GitHubClient() as client:
+            # Search trending
+            print("Finding trending Python repos...")
+            repos = await search_trending_repos("python", client=client)
+            print(f"Found {len(repos)} repos")
+            
+            # Analyze a user
+            print("\nAnalyzing torvalds...")
+            data = await analyze_user("torvalds", client=client)
         
-        # Analyze a user
-        print("\nAnalyzing torvalds...")
-        data = await analyze_user("torvalds")
         print(f"Name: {data['name']}")
         print(f"Followers: {data['followers']}")
         print(f"Total stars: {data['total_stars']}")
         print(f"Languages: {data['languages']}")
         
-        with open("data/github_analysis.json", "w") as f:
-            json.dump(data, f, indent=2)
+        with open("data/github_analysis.json", "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     asyncio.run(main())
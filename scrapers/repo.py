@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field
 
 
@@ -64,10 +65,17 @@ class GitHubScraper:
         "Accept": "application/vnd.github.v3+json"
     }
     
-    def __init__(self, timeout: int = 30, token: Optional[str] = None):
+    def __init__(self, timeout: int = 30, token: Optional[str] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         if token:
             self.HEADERS["Authorization"] = f"token {token}"
-        self.client = httpx.AsyncClient(headers=self.HEADERS, timeout=timeout)
+        self.client = httpx.AsyncClient(
+            headers=self.HEADERS,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=timeout,
+            transport=transport
+        )
     
     async def close(self):
         await self.client.aclose()
@@ -83,7 +91,7 @@ class GitHubScraper:
         url = f"{self.BASE_URL}/repos/{owner}/{repo}"
         response = await self.client.get(url)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         return Repository(
             name=data.get("name", ""),
@@ -95,7 +103,7 @@ class GitHubScraper:
             watchers=data.get("watchers_count", 0),
             open_issues=data.get("open_issues_count", 0),
             language=data.get("language"),
-            license=data.get("license", {}).get("name") if data.get("license") else None,
+            license=(data.get("license") or {}).get("name"),
             topics=data.get("topics", []),
             created_at=data.get("created_at", ""),
             updated_at=data.get("updated_at", ""),
@@ -103,51 +111,59 @@ class GitHubScraper:
             url=data.get("html_url", "")
         )
     
-    async def get_contributors(self, owner: str, repo: str, limit: int = 30) -> list[Contributor]:
-        """Get repository contributors"""
+    async def _get_contributors_raw(self, owner: str, repo: str, limit: int = 30) -> list[dict]:
+        """Get repository contributors as plain dicts, skipping validation"""
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/contributors"
         response = await self.client.get(url, params={"per_page": limit})
         response.raise_for_status()
         
-        contributors = []
-        for c in response.json():
-            contributors.append(Contributor(
-                login=c.get("login", ""),
-                avatar_url=c.get("avatar_url", ""),
-                contributions=c.get("contributions", 0),
-                url=c.get("html_url", "")
-            ))
-        return contributors
+        return [
+            {
+                "login": c.get("login", ""),
+                "avatar_url": c.get("avatar_url", ""),
+                "contributions": c.get("contributions", 0),
+                "url": c.get("html_url", "")
+            }
+            for c in orjson.loads(response.content)
+        ]
     
-    async def get_issues(self, owner: str, repo: str, state: str = "open", limit: int = 30) -> list[Issue]:
-        """Get repository issues"""
+    async def get_contributors(self, owner: str, repo: str, limit: int = 30) -> list[Contributor]:
+        """Get repository contributors"""
+        return [Contributor(**c) for c in await self._get_contributors_raw(owner, repo, limit)]
+    
+    async def _get_issues_raw(self, owner: str, repo: str, state: str = "open", limit: int = 30) -> list[dict]:
+        """Get repository issues as plain dicts, skipping validation"""
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/issues"
         response = await self.client.get(url, params={"state": state, "per_page": limit})
         response.raise_for_status()
         
         issues = []
-        for i in response.json():
+        for i in orjson.loads(response.content):
             # Skip PRs
             if i.get("pull_request"):
                 continue
-            issues.append(Issue(
-                number=i.get("number", 0),
-                title=i.get("title", ""),
-                state=i.get("state", ""),
-                author=i.get("user", {}).get("login", ""),
-                created_at=i.get("created_at", ""),
-                closed_at=i.get("closed_at"),
-                labels=[l.get("name", "") for l in i.get("labels", [])],
-                comments=i.get("comments", 0)
-            ))
+            issues.append({
+                "number": i.get("number", 0),
+                "title": i.get("title", ""),
+                "state": i.get("state", ""),
+                "author": (i.get("user") or {}).get("login", ""),
+                "created_at": i.get("created_at", ""),
+                "closed_at": i.get("closed_at"),
+                "labels": [l.get("name", "") for l in i.get("labels") or ()],
+                "comments": i.get("comments", 0)
+            })
         return issues
     
+    async def get_issues(self, owner: str, repo: str, state: str = "open", limit: int = 30) -> list[Issue]:
+        """Get repository issues"""
+        return [Issue(**i) for i in await self._get_issues_raw(owner, repo, state, limit)]
+    
     async def get_languages(self, owner: str, repo: str) -> dict:
         """Get language breakdown"""
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/languages"
         response = await self.client.get(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     async def search_repos(self, query: str, sort: str = "stars", limit: int = 30) -> list[dict]:
         """Search repositories"""
@@ -155,19 +171,22 @@ class GitHubScraper:
         response = await self.client.get(url, params={"q": query, "sort": sort, "per_page": limit})
         response.raise_for_status()
         
-        return [r.get("full_name") for r in response.json().get("items", [])]
+        return [r.get("full_name") for r in orjson.loads(response.content).get("items", [])]
     
     async def get_repo_full(self, owner: str, repo: str) -> dict:
         """Get complete repo data"""
-        repo_data = await self.get_repo(owner, repo)
-        contributors = await self.get_contributors(owner, repo)
-        issues = await self.get_issues(owner, repo)
-        languages = await self.get_languages(owner, repo)
+        # These are dumped straight back to dicts, so skip the model round-trip
+        repo_data, contributors, issues, languages = await asyncio.gather(
+            self.get_repo(owner, repo),
+            self._get_contributors_raw(owner, repo),
+            self._get_issues_raw(owner, repo),
+            self.get_languages(owner, repo)
+        )
         
         return {
             "repo": repo_data.to_dict(),
-            "contributors": [c.model_dump() for c in contributors],
-            "issues": [i.model_dump() for i in issues],
+            "contributors": contributors,
+            "issues": issues,
             "languages": languages
         }
 
@@ -180,7 +199,6 @@ async def scrape_repo(full_name: str) -> Repository:
 
 
 if __name__ == "__main__":
-    import json
     import sys
     
     async def main():
@@ -196,7 +214,7 @@ if __name__ == "__main__":
         print(f"Contributors: {len(data['contributors'])}")
         print(f"Issues: {len(data['issues'])}")
         
-        with open(f"data/{full_name.replace('/', '_')}.json", "w") as f:
-            json.dump(data, f, indent=2)
+        with open(f"data/{full_name.replace('/', '_')}.json", "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     asyncio.run(main())
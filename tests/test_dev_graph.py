@@ -0,0 +1,81 @@
+import io
+
+import networkx as nx
+import pytest
+
+from graph import dev_graph
+from graph.dev_graph import DeveloperGraph
+
+
+def _sample_graph() -> DeveloperGraph:
+    g = DeveloperGraph()
+    g.add_contributors_bulk("facebook/react", [("dan", 500), ("seb", 300), ("andrew", 200)])
+    g.add_contributor("vercel/next.js", "andrew", 50)
+    g.add_contributor("vercel/next.js", "lee", 400)
+    g.add_follow("lee", "dan")
+    g.add_follow("seb", "dan")
+    return g
+
+
+@pytest.mark.parametrize("backend", ["igraph", "networkx"])
+def test_scores_match_networkx(monkeypatch, backend) -> None:
+    if backend == "igraph":
+        if dev_graph.ig is None:
+            pytest.skip("igraph not installed")
+    else:
+        monkeypatch.setattr(dev_graph, "ig", None)
+
+    g = _sample_graph()
+    assert g.pagerank() == pytest.approx(nx.pagerank(g.graph), abs=1e-6)
+    assert g.degree_centrality() == pytest.approx(nx.degree_centrality(g.graph))
+
+
+def test_mutations_invalidate_cached_scores() -> None:
+    g = _sample_graph()
+    mutations = [
+        lambda: g.add_contributor("facebook/react", "new1", 10),
+        lambda: g.add_follow("dan", "new2"),
+        lambda: g.add_contributors_bulk("vercel/next.js", [("new3", 5)]),
+    ]
+    for mutate in mutations:
+        before_pr, before_dc = g.pagerank(), g.degree_centrality()
+        assert g.pagerank() is before_pr  # cached between mutations
+        mutate()
+        assert set(g.pagerank()) == set(g.degree_centrality()) == set(g.graph)
+        assert len(g.pagerank()) == len(before_pr) + 1
+        assert len(g.degree_centrality()) == len(before_dc) + 1
+
+
+def test_queries_return_labels() -> None:
+    g = _sample_graph()
+    top = g.get_top_developers(limit=2)
+    assert top[0][0] == "dev:dan"
+    assert all(label.startswith("dev:") for label, _ in top)
+
+    influential = g.get_influential_devs("facebook/react")
+    assert {label for label, _ in influential} == {"dev:dan", "dev:seb", "dev:andrew"}
+    assert g.get_influential_devs("unknown/repo") == []
+
+    assert g.find_connections("lee", "dan") == ["dev:lee", "dev:dan"]
+    assert g.find_connections("dan", "lee") == []
+    assert g.find_connections("lee", "nobody") == []
+
+
+def test_gexf_export_round_trips_edge_relations() -> None:
+    g = DeveloperGraph()
+    g.add_contributor("facebook/react", "acdlite", 200)
+    g.add_follow("acdlite", "dan_abramov")
+
+    exported = g.export_graph("gexf")
+    assert 'type="contributed_to"' not in exported
+
+    graph = nx.read_gexf(io.BytesIO(exported.encode()))
+    edges = {
+        (graph.nodes[u]["label"], graph.nodes[v]["label"]): data
+        for u, v, data in graph.edges(data=True)
+    }
+    assert edges[("dev:acdlite", "repo:facebook/react")]["relation"] == "contributed_to"
+    assert edges[("dev:acdlite", "repo:facebook/react")]["weight"] == 200
+    assert edges[("dev:acdlite", "dev:dan_abramov")]["relation"] == "follows"
+    # Exporting must not rename attributes on the live graph
+    assert all("type" in data for _, _, data in g.graph.edges(data=True))
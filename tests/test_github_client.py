@@ -0,0 +1,326 @@
+import asyncio
+import time
+
+import httpx
+
+from scrapers import github
+from scrapers.github import GitHubClient
+
+
+def _client(reset: int) -> GitHubClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+        )
+
+    return GitHubClient(transport=httpx.MockTransport(handler))
+
+
+def _sleeps_before_second_request(monkeypatch, reset: int) -> list:
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def run():
+        async with _client(reset) as client:
+            await client.get("https://api.github.com/rate_limit")
+            await client.get("https://api.github.com/rate_limit")
+
+    monkeypatch.setattr(github.asyncio, "sleep", fake_sleep)
+    asyncio.run(run())
+    return sleeps
+
+
+def test_waits_until_rate_limit_reset(monkeypatch) -> None:
+    sleeps = _sleeps_before_second_request(monkeypatch, int(time.time()) + 2)
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 2
+
+
+def test_rate_limit_wait_is_clamped(monkeypatch) -> None:
+    sleeps = _sleeps_before_second_request(monkeypatch, int(time.time()) + 10 ** 9)
+    assert len(sleeps) == 1
+    assert sleeps[0] <= GitHubClient.MAX_RESET_WAIT
+
+
+def test_helpers_run_across_event_loops(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/search/repositories":
+            return httpx.Response(200, json={"items": [{"full_name": "a/b"}]})
+        if request.url.path == "/users/alice":
+            return httpx.Response(200, json={"name": "Alice"})
+        return httpx.Response(200, json=[{"stargazers_count": 3, "language": "Go"}])
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        github, "GitHubClient", lambda: GitHubClient(transport=transport)
+    )
+
+    # Each asyncio.run gets a fresh loop; a client shared between them would fail
+    for _ in range(2):
+        assert asyncio.run(github.search_trending_repos("python")) == [{"full_name": "a/b"}]
+        user = asyncio.run(github.analyze_user("alice"))
+        assert user["name"] == "Alice"
+        assert user["total_stars"] == 3
+
+
+def _paged_handler(total: int, requests: list, key: str = ""):
+    """Serve `total` numbered items, GitHub-style, with a rel="last" Link"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        requests.append((page, per_page))
+        start = (page - 1) * per_page
+        items = [{"id": i, "login": f"u{i}"} for i in range(start, min(start + per_page, total))]
+        last = -(-total // per_page)
+        headers = {}
+        if last > 1:
+            headers["Link"] = (
+                f'<{request.url.copy_set_param("page", page + 1)}>; rel="next", '
+                f'<{request.url.copy_set_param("page", last)}>; rel="last"'
+            )
+        return httpx.Response(200, json={key: items} if key else items, headers=headers)
+
+    return handler
+
+
+def _paginate(handler, **kwargs) -> list:
+    async def run():
+        async with GitHubClient(transport=httpx.MockTransport(handler)) as client:
+            return await client._paginate("https://api.github.com/items", **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_paginate_fetches_pages_up_to_last_link() -> None:
+    requests = []
+    items = _paginate(_paged_handler(350, requests), limit=1000)
+    assert [i["id"] for i in items] == list(range(350))
+    assert sorted(requests) == [(1, 100), (2, 100), (3, 100), (4, 100)]
+
+
+def test_paginate_single_page_without_link() -> None:
+    requests = []
+    items = _paginate(_paged_handler(40, requests), limit=1000)
+    assert len(items) == 40
+    assert requests == [(1, 100)]
+
+
+def test_paginate_stops_at_limit() -> None:
+    requests = []
+    items = _paginate(_paged_handler(1000, requests), limit=250)
+    assert [i["id"] for i in items] == list(range(250))
+    assert sorted(requests) == [(1, 100), (2, 100), (3, 100)]
+
+
+def test_paginate_search_items_key() -> None:
+    requests = []
+    items = _paginate(_paged_handler(150, requests, key="items"), limit=1000, key="items")
+    assert [i["id"] for i in items] == list(range(150))
+    assert sorted(requests) == [(1, 100), (2, 100)]
+
+
+def test_last_page_ignores_per_page() -> None:
+    def response(link: str) -> httpx.Response:
+        return httpx.Response(200, headers={"Link": link})
+
+    url = "https://api.github.com/items"
+    assert GitHubClient._last_page(response(f'<{url}?per_page=100&page=7>; rel="last"')) == 7
+    assert GitHubClient._last_page(response(f'<{url}?page=7&per_page=100>; rel="last"')) == 7
+    assert GitHubClient._last_page(response(f'<{url}?per_page=100>; rel="last"')) == 1
+    assert GitHubClient._last_page(httpx.Response(200)) == 1
+
+
+def test_etag_304_serves_cached_pages() -> None:
+    requests = []
+    paged = _paged_handler(250, requests)
+    not_modified = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        etag = f'"page-{request.url.params["page"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            not_modified.append(etag)
+            return httpx.Response(304, headers={"ETag": etag})
+        response = paged(request)
+        response.headers["ETag"] = etag
+        return response
+
+    async def run():
+        async with GitHubClient(transport=httpx.MockTransport(handler)) as client:
+            first = await client.get_stargazers("a", "b")
+            second = await client.get_stargazers("a", "b")
+            cached = await client.get(
+                "https://api.github.com/repos/a/b/stargazers",
+                params={"per_page": 100, "page": 1},
+            )
+            return first, second, cached
+
+    first, second, cached = asyncio.run(run())
+    assert first == second == [f"u{i}" for i in range(250)]
+    # The second run got only 304s, and still found pages 2-3 via the cached Link
+    assert sorted(not_modified) == ['"page-1"', '"page-1"', '"page-2"', '"page-3"']
+    assert cached.status_code == 200
+    assert cached.links["last"]["url"].endswith("page=3")
+
+
+def test_etag_memory_cache_is_bounded(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={}, headers={"ETag": f'"{request.url.path}"'})
+
+    monkeypatch.setattr(GitHubClient, "ETAG_CACHE_SIZE", 2)
+
+    async def run():
+        async with GitHubClient(transport=httpx.MockTransport(handler)) as client:
+            for name in ("a", "b", "a", "c"):
+                await client.get(f"https://api.github.com/users/{name}")
+            return list(client._etag_cache)
+
+    assert asyncio.run(run()) == [
+        "https://api.github.com/users/a",
+        "https://api.github.com/users/c",
+    ]
+
+
+def _run_requests(monkeypatch, handler, urls: list) -> tuple:
+    """GET each url in turn, returning (sleeps, status codes or the raised error)"""
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def run():
+        results = []
+        async with GitHubClient(transport=httpx.MockTransport(handler)) as client:
+            for url in urls:
+                try:
+                    results.append((await client.get(url)).status_code)
+                except httpx.HTTPStatusError as e:
+                    results.append(e.response.status_code)
+        return results
+
+    monkeypatch.setattr(github.asyncio, "sleep", fake_sleep)
+    return sleeps, asyncio.run(run())
+
+
+def test_rate_limit_budgets_are_per_resource(monkeypatch) -> None:
+    reset = str(int(time.time()) + 50)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/search/"):
+            headers = {"X-RateLimit-Resource": "search", "X-RateLimit-Remaining": "1"}
+        else:
+            headers = {"X-RateLimit-Resource": "core", "X-RateLimit-Remaining": "4000"}
+        return httpx.Response(200, json={}, headers={**headers, "X-RateLimit-Reset": reset})
+
+    sleeps, results = _run_requests(monkeypatch, handler, [
+        "https://api.github.com/users/a",
+        "https://api.github.com/search/repositories",
+        "https://api.github.com/users/a",
+    ])
+    assert results == [200, 200, 200]
+    assert sleeps == []
+
+    # The spent search budget still throttles the next search
+    sleeps, _ = _run_requests(monkeypatch, handler, [
+        "https://api.github.com/search/repositories",
+        "https://api.github.com/search/repositories",
+    ])
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 50
+
+
+def _flaky_handler(failure: httpx.Response, failures: int, calls: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= failures:
+            return failure
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_retries_after_secondary_rate_limit(monkeypatch) -> None:
+    for status in (403, 429):
+        calls = []
+        failure = httpx.Response(status, headers={"Retry-After": "7"})
+        sleeps, results = _run_requests(
+            monkeypatch, _flaky_handler(failure, 1, calls), ["https://api.github.com/users/a"]
+        )
+        assert results == [200]
+        assert sleeps == [7.0]
+        assert len(calls) == 2
+
+
+def test_retries_after_primary_rate_limit_reset(monkeypatch) -> None:
+    calls = []
+    failure = httpx.Response(403, headers={
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time()) + 30),
+    })
+    sleeps, results = _run_requests(
+        monkeypatch, _flaky_handler(failure, 1, calls), ["https://api.github.com/users/a"]
+    )
+    assert results == [200]
+    assert len(calls) == 2
+    # One zero-delay retry, then _acquire waits out the window
+    assert sleeps[0] == 0
+    assert len(sleeps) == 2 and 0 < sleeps[1] <= 30
+
+
+def test_retries_server_errors_with_backoff(monkeypatch) -> None:
+    calls = []
+    sleeps, results = _run_requests(
+        monkeypatch, _flaky_handler(httpx.Response(502), 2, calls), ["https://api.github.com/users/a"]
+    )
+    assert results == [200]
+    assert sleeps == [1, 2]
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_retries(monkeypatch) -> None:
+    calls = []
+    sleeps, results = _run_requests(
+        monkeypatch, _flaky_handler(httpx.Response(503), 100, calls), ["https://api.github.com/users/a"]
+    )
+    assert results == [503]
+    assert len(calls) == GitHubClient.MAX_RETRIES + 1
+    assert sleeps == [2 ** i for i in range(GitHubClient.MAX_RETRIES)]
+
+
+def test_polling_with_304s_does_not_spend_budget(monkeypatch) -> None:
+    reset = str(int(time.time()) + 1800)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"ETag": '"v1"', "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": reset}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json={"name": "b"}, headers=headers)
+
+    sleeps, results = _run_requests(
+        monkeypatch, handler, ["https://api.github.com/repos/a/b"] * 30
+    )
+    assert results == [200] * 30
+    assert sleeps == []
+
+
+def test_search_stops_at_result_cap() -> None:
+    requests = []
+    handler = _paged_handler(5000, requests, key="items")
+
+    async def run():
+        async with GitHubClient(transport=httpx.MockTransport(handler)) as client:
+            return await client.search_repos("stars:>100", per_page=5000)
+
+    items = asyncio.run(run())
+    assert len(items) == GitHubClient.SEARCH_RESULT_CAP
+    assert max(page for page, _ in requests) == 10
+
+
+def test_paginate_zero_limit_sends_no_request() -> None:
+    requests = []
+    assert _paginate(_paged_handler(100, requests), limit=0) == []
+    assert requests == []
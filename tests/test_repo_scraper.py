@@ -0,0 +1,49 @@
+import asyncio
+
+import httpx
+
+from scrapers.repo import GitHubScraper
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.endswith("/contributors"):
+        return httpx.Response(200, json=[
+            {"login": "alice", "avatar_url": "a.png", "contributions": 12, "html_url": "u/alice"},
+            {"login": "bob", "avatar_url": "b.png", "html_url": "u/bob"},
+        ])
+    if path.endswith("/issues"):
+        return httpx.Response(200, json=[
+            {
+                "number": 1,
+                "title": "Crash",
+                "state": "open",
+                "user": {"login": "alice"},
+                "created_at": "2024-01-01T00:00:00Z",
+                "labels": [{"name": "bug"}],
+                "comments": 3,
+            },
+            # Deleted accounts come back as a null user
+            {"number": 2, "title": "Ghost", "state": "closed", "user": None,
+             "created_at": "2024-01-02T00:00:00Z", "closed_at": "2024-01-03T00:00:00Z"},
+            {"number": 3, "title": "A PR", "pull_request": {"url": "x"}},
+        ])
+    if path.endswith("/languages"):
+        return httpx.Response(200, json={"Python": 100})
+    return httpx.Response(200, json={"name": "b", "full_name": "a/b", "html_url": "h"})
+
+
+def test_repo_full_matches_validated_models() -> None:
+    async def run():
+        async with GitHubScraper(transport=httpx.MockTransport(_handler)) as scraper:
+            return (
+                await scraper.get_repo_full("a", "b"),
+                await scraper.get_contributors("a", "b"),
+                await scraper.get_issues("a", "b"),
+            )
+
+    full, contributors, issues = asyncio.run(run())
+    assert full["contributors"] == [c.model_dump() for c in contributors]
+    assert full["issues"] == [i.model_dump() for i in issues]
+    assert [i["author"] for i in full["issues"]] == ["alice", ""]
+    assert full["languages"] == {"Python": 100}
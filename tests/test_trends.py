@@ -0,0 +1,107 @@
+from analysis import trends
+from analysis.trends import TrendAnalyzer
+
+
+def test_top_repos_sees_growth_rate_after_breakout_detection() -> None:
+    analyzer = TrendAnalyzer()
+    analyzer.add_repo({"name": "old", "stars": 1000, "created_at": "2010-01-01T00:00:00Z"})
+    analyzer.add_repo({"name": "new", "stars": 500, "created_at": "2025-01-01T00:00:00Z"})
+
+    # Builds the DataFrame cache before growth_rate exists
+    analyzer.get_top_repos("forks")
+    analyzer.detect_breakout_repos()
+
+    assert [r["name"] for r in analyzer.get_top_repos("growth_rate")] == ["new", "old"]
+
+
+def test_failed_add_repo_leaves_columns_aligned() -> None:
+    analyzer = TrendAnalyzer()
+    analyzer.add_repo({"name": "a", "stars": 10})
+    analyzer.add_repo({"name": "b", "stars": "12"})
+    try:
+        analyzer.add_repo({"name": "bad", "stars": "lots", "language": "Go"})
+    except ValueError:
+        pass
+    analyzer.add_repo({"name": "c", "stars": 999})
+
+    assert len(analyzer.data) == len(analyzer._stars) == len(analyzer._created_at) == 3
+    assert [r["name"] for r in analyzer.get_top_repos()] == ["c", "b", "a"]
+    assert analyzer.get_language_trends() == {}
+    assert [r["name"] for r in analyzer.detect_breakout_repos(min_stars=0)] == ["a", "b", "c"]
+
+
+def _breakout_repos() -> list:
+    repos = [
+        # Ties: identical growth must keep input order
+        {"name": "tie1", "stars": 900, "created_at": "2024-01-01T00:00:00Z"},
+        {"name": "tie2", "stars": 900, "created_at": "2024-01-01T00:00:00Z"},
+        {"name": "fast", "stars": 5000, "created_at": "2025-06-01T00:00:00Z"},
+        {"name": "slow", "stars": 300, "created_at": "2012-01-01T00:00:00Z"},
+        # NaT: missing or malformed dates score 0 but still qualify
+        {"name": "no-date", "stars": 700},
+        {"name": "bad-date", "stars": 800, "created_at": "not a date"},
+        # Below min_stars
+        {"name": "small", "stars": 50, "created_at": "2025-06-01T00:00:00Z"},
+    ]
+    repos += [
+        {"name": f"r{i}", "stars": 100 + i * 37, "created_at": f"20{10 + i % 15}-03-01T00:00:00Z"}
+        for i in range(20)
+    ]
+    return repos
+
+
+def _detect(monkeypatch, njit, kernel, min_stars: int = 100) -> list:
+    monkeypatch.setattr(trends, "njit", njit)
+    monkeypatch.setattr(trends, "_breakout_kernel", kernel)
+    analyzer = TrendAnalyzer()
+    analyzer.add_repo_batch(_breakout_repos())
+    return [(r["name"], r["growth_rate"]) for r in analyzer.detect_breakout_repos(min_stars)]
+
+
+def test_breakout_kernel_matches_numpy_fallback(monkeypatch) -> None:
+    kernel = trends._breakout_kernel
+    py_kernel = getattr(kernel, "py_func", kernel)
+
+    for min_stars in (100, 650):
+        fallback = _detect(monkeypatch, None, kernel, min_stars)
+        assert _detect(monkeypatch, object(), py_kernel, min_stars) == fallback
+        if kernel is not py_kernel:
+            assert _detect(monkeypatch, object(), kernel, min_stars) == fallback
+
+    # With few enough candidates the undated repos make the cut at 0 growth
+    names = [name for name, _ in _detect(monkeypatch, None, kernel, 650)]
+    assert names[-2:] == ["no-date", "bad-date"]
+
+    names = [name for name, _ in _detect(monkeypatch, None, kernel)]
+    assert len(names) == 10
+    assert names[0] == "fast"
+    assert names.index("tie1") + 1 == names.index("tie2")
+    assert "small" not in names
+
+
+def test_running_aggregates_after_batches() -> None:
+    analyzer = TrendAnalyzer()
+    analyzer.add_repo_batch([
+        {"name": "a", "language": "Python", "stars": 10, "topics": ["ml", "ai"]},
+        {"name": "b", "language": "Go", "stars": 30, "topics": ["cli"]},
+    ])
+    assert analyzer.get_language_trends() == {"Python": 1, "Go": 1}
+
+    analyzer.add_repo_batch([
+        {"name": "c", "language": "Python", "stars": 50, "topics": ["ml"]},
+        {"name": "d", "language": None, "stars": 4},
+        {"name": "e", "stars": 6, "topics": []},
+        {"name": "f", "language": "", "stars": 7},
+    ])
+    analyzer.add_repo({"name": "g", "language": "Go", "topics": ["ml", "cli"]})
+
+    assert len(analyzer.data) == 7
+    assert analyzer.get_language_trends() == {"Python": 2, "Go": 2}
+    assert analyzer.get_topic_trends() == {"ml": 3, "cli": 2, "ai": 1}
+    # Missing and None languages share "Unknown"; empty strings keep their own key
+    assert analyzer.generate_heatmap_data() == {
+        "Python": 30.0,
+        "Go": 15.0,
+        "Unknown": 5.0,
+        "": 7.0,
+    }